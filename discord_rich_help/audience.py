@@ -0,0 +1,203 @@
+"""
+MIT License
+
+Copyright (c) 2023 PescadoGames
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Dict, Hashable, Optional, Tuple
+    from typing_extensions import TypeAlias
+
+    from discord.ext.commands import Command
+
+    AudienceKey: TypeAlias = Hashable
+
+__all__ = (
+    'AudienceCache',
+)
+
+
+class AudienceCache:
+    """A class for caching command visibility per audience class.
+
+    An audience class is a group of invokers who see the same set of commands,
+    e.g. members who share the same permissions and roles in a channel.
+    Visibility of each command is stored as a bit of an integer bitset.
+
+    A bit belongs to a command object, so a command which is replaced by another
+    object with the same name (e.g. on an extension reload) is checked again.
+
+    .. versionadded:: 0.2
+
+    Parameters
+    -----------
+    max_size: :class:`int`
+        The max number of audience classes to keep.
+        The least recently used audience class is discarded first.
+    ttl: Optional[:class:`float`]
+        Seconds to keep the visibilities of an audience class.
+        If None, they are kept until :meth:`clear` is called.
+
+    Attributes
+    -----------
+    max_size: :class:`int`
+        The max number of audience classes to keep.
+    ttl: Optional[:class:`float`]
+        Seconds to keep the visibilities of an audience class.
+    """
+
+    __slots__ = (
+        '__bits',
+        '__buckets',
+        'max_size',
+        'ttl',
+    )
+
+    def __init__(self, *, max_size: int = 128, ttl: Optional[float] = 300.0) -> None:
+        self.max_size: int = max_size
+        self.ttl: Optional[float] = ttl
+        self.__bits: Dict[str, Tuple[Command[Any, ..., Any], int]] = {}
+        self.__buckets: OrderedDict[AudienceKey, Tuple[int, int, float]] = OrderedDict()
+
+    def _get_bit(self, command: Command[Any, ..., Any]) -> int:
+        """Return a bit of a command in a bitset.
+
+        If another command object has the bit, the bit is forgotten by all audience classes
+        and given to `command` .
+
+        .. versionadded:: 0.2
+
+        Parameters
+        -----------
+        command: :class:`Command`
+            A command to get the bit.
+
+        Returns
+        --------
+        :class:`int`
+            A bit of the command.
+        """
+        name: str = command.qualified_name
+        entry: Optional[Tuple[Command[Any, ..., Any], int]] = self.__bits.get(name)
+
+        if entry is None:
+            bit: int = 1 << len(self.__bits)
+
+        else:
+            owner, bit = entry
+            if owner is command:
+                return bit
+
+            for key, (known, visible, created) in self.__buckets.items():
+                self.__buckets[key] = (known & ~bit, visible & ~bit, created)
+
+        self.__bits[name] = (command, bit)
+        return bit
+
+    def _get_bucket(self, key: AudienceKey) -> Optional[Tuple[int, int, float]]:
+        """Return a bitset of an audience class unless it has expired.
+
+        .. versionadded:: 0.2
+
+        Parameters
+        -----------
+        key: :class:`AudienceKey`
+            A key of an audience class.
+
+        Returns
+        --------
+        Optional[Tuple[:class:`int`, :class:`int`, :class:`float`]]
+            The checked bits, the visible bits and the time the bitset was created.
+        """
+        bucket: Optional[Tuple[int, int, float]] = self.__buckets.get(key)
+        if bucket is None:
+            return None
+
+        if self.ttl is not None and time.monotonic() - bucket[2] >= self.ttl:
+            del self.__buckets[key]
+            return None
+
+        self.__buckets.move_to_end(key)
+        return bucket
+
+    def get(self, key: AudienceKey, command: Command[Any, ..., Any]) -> Optional[bool]:
+        """Return the cached visibility of a command.
+
+        .. versionadded:: 0.2
+
+        Parameters
+        -----------
+        key: :class:`AudienceKey`
+            A key of an audience class.
+        command: :class:`Command`
+            A command to look up.
+
+        Returns
+        --------
+        Optional[:class:`bool`]
+            Whether the command is visible, or None if it is not cached yet.
+        """
+        bit: int = self._get_bit(command)
+        bucket: Optional[Tuple[int, int, float]] = self._get_bucket(key)
+        if bucket is None or not bucket[0] & bit:
+            return None
+
+        return bool(bucket[1] & bit)
+
+    def set(self, key: AudienceKey, command: Command[Any, ..., Any], visible: bool) -> None:
+        """Cache the visibility of a command.
+
+        .. versionadded:: 0.2
+
+        Parameters
+        -----------
+        key: :class:`AudienceKey`
+            A key of an audience class.
+        command: :class:`Command`
+            A command to cache.
+        visible: :class:`bool`
+            Whether the command is visible.
+        """
+        bit: int = self._get_bit(command)
+        known, bits, created = self._get_bucket(key) or (0, 0, time.monotonic())
+        known |= bit
+        bits = bits | bit if visible else bits & ~bit
+
+        self.__buckets[key] = (known, bits, created)
+        self.__buckets.move_to_end(key)
+        while len(self.__buckets) > self.max_size:
+            self.__buckets.popitem(last=False)
+
+    def clear(self) -> None:
+        """Discard all cached visibilities.
+
+        Call this after commands or their checks have changed.
+
+        .. versionadded:: 0.2
+        """
+        self.__bits.clear()
+        self.__buckets.clear()
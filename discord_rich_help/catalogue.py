@@ -0,0 +1,234 @@
+"""
+MIT License
+
+Copyright (c) 2023 PescadoGames
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from itertools import chain
+from typing import TYPE_CHECKING
+
+from discord import AppCommandType
+from discord.app_commands import Command as SlashCommand
+from discord.app_commands import Group as SlashGroup
+from discord.ext.commands import Command
+
+if TYPE_CHECKING:
+    from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+    from typing_extensions import TypeAlias
+
+    from discord.ext.commands.bot import BotBase
+
+    AnyCommand: TypeAlias = Union[Command[Any, ..., Any], SlashCommand[Any, ..., Any]]
+
+__all__ = (
+    'HelpCatalogue',
+)
+
+_log = logging.getLogger(__name__)
+
+
+class HelpCatalogue:
+    """A class for precomputed data of help commands.
+
+    This keeps sorted lists of commands and the text of their embed fields,
+    so that they are not computed on every help command.
+
+    .. versionadded:: 0.2
+
+    Attributes
+    -----------
+    duration: Optional[:class:`float`]
+        Seconds taken by the last :meth:`warm_up` , or None if it has not finished yet.
+    """
+
+    __slots__ = (
+        '__fields',
+        '__sorted',
+        'duration',
+    )
+
+    def __init__(self) -> None:
+        self.duration: Optional[float] = None
+        self.__fields: Dict[AnyCommand, Tuple[str, str]] = {}
+        self.__sorted: Dict[str, List[AnyCommand]] = {}
+
+    @property
+    def is_warm(self) -> bool:
+        """Whether :meth:`warm_up` has finished.
+
+        .. versionadded:: 0.2
+        """
+        return self.duration is not None
+
+    def get_sorted(self, kind: str, commands: Iterable[AnyCommand]) -> List[AnyCommand]:
+        """Return a list of commands sorted by name.
+
+        The sorted list is reused while the set of commands is unchanged.
+        When it has changed, embed fields of commands which are no longer listed are discarded.
+
+        .. versionadded:: 0.2
+
+        Parameters
+        -----------
+        kind: :class:`str`
+            A kind of commands, e.g. ``'message'`` or ``'slash'`` .
+        commands: Iterable[:class:`AnyCommand`]
+            Commands to sort.
+
+        Returns
+        --------
+        List[:class:`AnyCommand`]
+            A sorted list of commands.
+        """
+        commands = list(commands)
+        cached: Optional[List[AnyCommand]] = self.__sorted.get(kind)
+
+        if cached is None or len(cached) != len(commands) or set(cached) != set(commands):
+            cached = sorted(commands, key=lambda command: command.name)
+            self.__sorted[kind] = cached
+            self._prune_fields()
+
+        return list(cached)
+
+    def _prune_fields(self) -> None:
+        """Discard embed fields of commands which are not in any sorted list.
+
+        .. versionadded:: 0.2
+        """
+        listed: Set[AnyCommand] = set(chain.from_iterable(self.__sorted.values()))
+        for command in [command for command in self.__fields if command not in listed]:
+            del self.__fields[command]
+
+    def get_field(self, command: AnyCommand) -> Tuple[str, str]:
+        """Return the name and value of an embed field for a command.
+
+        The name does not contain the command prefix.
+
+        .. versionadded:: 0.2
+
+        Parameters
+        -----------
+        command: :class:`AnyCommand`
+            A command to render.
+
+        Raises
+        -------
+        TypeError
+            `command` is neither a message command nor a slash command, e.g. a context menu.
+
+        Returns
+        --------
+        Tuple[:class:`str`, :class:`str`]
+            The name and value of the field.
+        """
+        field: Optional[Tuple[str, str]] = self.__fields.get(command)
+        if field is not None:
+            return field
+
+        if isinstance(command, Command):
+            field = (f'{command.name} {command.signature}', command.short_doc)
+
+        elif isinstance(command, (SlashCommand, SlashGroup)):
+            params = [f'[{p.display_name}]' for p in getattr(command, 'parameters', ())]
+            param_str = ' '.join(params) if params else ''
+            field = (f'{command.name} {param_str}', command.description)
+
+        else:
+            raise TypeError(f'{command!r} is not a message command nor a slash command')
+
+        self.__fields[command] = field
+        return field
+
+    async def warm_up(self, bot: BotBase, *, chunk_size: int = 10, slice_time: float = 0.005) -> float:
+        """|coro|
+
+        Precompute the sorted lists and embed fields of all commands of `bot` .
+        Context menus are skipped since they are not shown in help commands.
+
+        This yields to the event loop after `chunk_size` commands or `slice_time` seconds,
+        whichever comes first, so that it does not block the bot.
+
+        .. versionadded:: 0.2
+
+        Parameters
+        -----------
+        bot: :class:`BotBase`
+            A bot to warm up.
+        chunk_size: :class:`int`
+            The max number of commands to process at once.
+        slice_time: :class:`float`
+            The max seconds to run without yielding.
+
+        Raises
+        -------
+        ValueError
+            `chunk_size` is less than 1 or `slice_time` is not positive.
+
+        Returns
+        --------
+        :class:`float`
+            Seconds taken to warm up.
+        """
+        if chunk_size < 1:
+            raise ValueError('"chunk_size" must be 1 or more')
+
+        if slice_time <= 0:
+            raise ValueError('"slice_time" must be positive')
+
+        start: float = time.perf_counter()
+        self.duration = None
+
+        commands: List[AnyCommand] = self.get_sorted('message', bot.commands)
+        slash_commands: List[AnyCommand] = self.get_sorted(
+            'slash',
+            bot.tree.get_commands(type=AppCommandType.chat_input),  # type: ignore
+        )
+        total: int = len(commands) + len(slash_commands)
+
+        slice_start: float = time.perf_counter()
+        chunk: int = 0
+        for idx, command in enumerate(chain(commands, slash_commands), start=1):
+            self.get_field(command)
+            chunk += 1
+            if chunk >= chunk_size or time.perf_counter() - slice_start >= slice_time:
+                _log.debug('Warming up help commands: %d/%d', idx, total)
+                await asyncio.sleep(0)
+                slice_start = time.perf_counter()
+                chunk = 0
+
+        self.duration = time.perf_counter() - start
+        _log.info('Warmed up help commands for %d commands in %.3f seconds', total, self.duration)
+
+        return self.duration
+
+    def clear(self) -> None:
+        """Discard all precomputed data.
+
+        .. versionadded:: 0.2
+        """
+        self.duration = None
+        self.__fields.clear()
+        self.__sorted.clear()
@@ -25,20 +25,23 @@ SOFTWARE.
 from __future__ import annotations
 
 import asyncio
+import logging
 from typing import Optional, TYPE_CHECKING
 
-from discord import Color, Embed
+from discord import AppCommandType, Color, Embed
 from discord.app_commands import command as slash_command
 from discord.app_commands import describe, locale_str, rename
-from discord.ext.commands import Cog, Context, Group, HelpCommand
+from discord.ext.commands import Cog, CommandError, Context, Group, HelpCommand
 
+from .audience import AudienceCache
+from .catalogue import HelpCatalogue
 from .text import text
 from .ui import HelpCommandView
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
-    from typing import Any, Generator, Iterable, List, Union
-    from typing_extensions import TypeAlias
+    from typing import Any, Generator, Hashable, Iterable, List, Union
+    from typing_extensions import Self, TypeAlias
 
     from discord import Interaction
     from discord.app_commands import Command as SlashCommand
@@ -54,6 +57,8 @@ __all__ = (
     'RichHelpCommand',
 )
 
+_log = logging.getLogger(__name__)
+
 
 class RichHelpCommand(HelpCommand, Cog):
     """A class for a rich help command.
@@ -64,6 +69,15 @@ class RichHelpCommand(HelpCommand, Cog):
     -----------
     embed_color: Union[:class:`Color`, :class:`int`]
         An embed color for help commands.
+    audience_cache: :class:`bool`
+        Whether to share the result of command checks among invokers in the same audience class.
+        See :meth:`get_audience_key` and :meth:`clear_audience_cache` for details.
+
+        .. versionadded:: 0.2
+    warm_up: :class:`bool`
+        Whether to run :meth:`warm_up` in the background when the bot is ready.
+
+        .. versionadded:: 0.2
 
     Attributes
     -----------
@@ -72,25 +86,58 @@ class RichHelpCommand(HelpCommand, Cog):
     """
 
     __slots__ = (
+        '_audience_cache',
+        '_bot',
+        '_catalogue',
         '_last_member',
+        '_warm_up_on_ready',
+        '_warm_up_task',
         'embed_color',
         'current_page',
         'pages',
     )
 
-    def __init__(self, *, embed_color: Union[Color, int] = Color.blurple()) -> None:
+    def __init__(
+            self,
+            *,
+            embed_color: Union[Color, int] = Color.blurple(),
+            audience_cache: bool = False,
+            warm_up: bool = False,
+    ) -> None:
         super().__init__(command_attrs={'help': 'Show this message'})
         self._last_member = None
+        self._audience_cache: Optional[AudienceCache] = AudienceCache() if audience_cache else None
+        self._bot: Optional[BotBase] = None
+        self._catalogue: HelpCatalogue = HelpCatalogue()
+        self._warm_up_on_ready: bool = warm_up
+        self._warm_up_task: Optional[asyncio.Task[float]] = None
         self.current_page: int
         self.pages: List[List[AnyCommand]]
         self.embed_color: Union[Color, int] = embed_color
 
+    def copy(self) -> Self:
+        """Return a copy of this help command.
+
+        The audience cache and the catalogue are shared with the copy.
+
+        .. versionadded:: 0.2
+
+        Returns
+        --------
+        :class:`RichHelpCommand`
+        """
+        obj: Self = super().copy()
+        obj._audience_cache = self._audience_cache
+        obj._catalogue = self._catalogue
+        return obj
+
     def _add_to_bot(self, bot: BotBase) -> None:
         """Add help commands to `bot` .
 
         .. versionadded:: 0.1
         """
         super()._add_to_bot(bot)
+        self._bot = bot
         asyncio.run(bot.add_cog(self))
 
     def _remove_from_bot(self, bot: BotBase) -> None:
@@ -99,8 +146,84 @@ class RichHelpCommand(HelpCommand, Cog):
         .. versionadded:: 0.1
         """
         super()._remove_from_bot(bot)
+        if self._warm_up_task is not None:
+            self._warm_up_task.cancel()
+            self._warm_up_task = None
+
+        self._bot = None
+        self._catalogue.clear()
+        self.clear_audience_cache()
         asyncio.run(bot.remove_cog(__class__.__name__))  # type: ignore
 
+    async def warm_up(self, *, chunk_size: int = 10, slice_time: float = 0.005) -> float:
+        """|coro|
+
+        Precompute the sorted lists and embed fields of all commands,
+        so that the first help command does not pay for them.
+
+        This yields to the event loop after `chunk_size` commands or `slice_time` seconds,
+        whichever comes first.
+        Progress is logged at the debug level and the duration at the info level.
+        When finished, ``on_rich_help_warm_up`` is dispatched with the duration in seconds.
+
+        This can also be called from :meth:`Bot.setup_hook` after all commands are added.
+
+        .. versionadded:: 0.2
+
+        Parameters
+        -----------
+        chunk_size: :class:`int`
+            The max number of commands to process at once.
+        slice_time: :class:`float`
+            The max seconds to run without yielding.
+
+        Raises
+        -------
+        ValueError
+            The help command is not added to any bot, or `chunk_size` or `slice_time` is invalid.
+
+        Returns
+        --------
+        :class:`float`
+            Seconds taken to warm up.
+        """
+        if self._bot is None:
+            raise ValueError('This help command is not added to any bot')
+
+        duration: float = await self._catalogue.warm_up(self._bot, chunk_size=chunk_size, slice_time=slice_time)
+        self._bot.dispatch('rich_help_warm_up', duration)  # type: ignore
+
+        return duration
+
+    @Cog.listener()
+    async def on_ready(self) -> None:
+        """|coro|
+
+        Start :meth:`warm_up` in the background if it is enabled.
+
+        .. versionadded:: 0.2
+        """
+        if self._warm_up_on_ready and self._warm_up_task is None:
+            self._warm_up_task = asyncio.create_task(self.warm_up())
+            self._warm_up_task.add_done_callback(self._on_warm_up_done)
+
+    def _on_warm_up_done(self, task: asyncio.Task[float]) -> None:
+        """Log an error raised by the background warm-up.
+
+        .. versionadded:: 0.2
+
+        Parameters
+        -----------
+        task: :class:`asyncio.Task`
+            A finished task of :meth:`warm_up` .
+        """
+        if task.cancelled():
+            return
+
+        error: Optional[BaseException] = task.exception()
+        if error is not None:
+            _log.error('Failed to warm up help commands', exc_info=error)
+
     def is_interaction_based(self) -> bool:
         """Check if a command is a message command or a slash command.
 
@@ -212,23 +335,9 @@ class RichHelpCommand(HelpCommand, Cog):
         bot_help: Embed = Embed(title=text['help_title'], color=self.embed_color)
         bot_help.set_footer(text=f'Page {self.current_page}/{page_length}')
 
-        if self.is_interaction_based():
-            for command in self.pages[self.current_page - 1]:
-                params = [f'[{p.display_name}]' for p in command.parameters]  # type: ignore
-                param_str = ' '.join(params) if params else ''
-                bot_help.add_field(
-                    name=f'{prefix}{command.name} {param_str}',
-                    value=command.description,
-                    inline=False
-                )
-
-        else:
-            for command in self.pages[self.current_page - 1]:
-                bot_help.add_field(
-                    name=f'{prefix}{command.name} {command.signature}',  # type: ignore
-                    value=command.short_doc,  # type: ignore
-                    inline=False
-                )
+        for command in self.pages[self.current_page - 1]:
+            name, value = self._catalogue.get_field(command)
+            bot_help.add_field(name=f'{prefix}{name}', value=value, inline=False)
 
         return bot_help
 
@@ -240,12 +349,17 @@ class RichHelpCommand(HelpCommand, Cog):
 
         .. versionadded:: 0.1
         """
-        filtered: List[AnyCommand]
+        commands: List[AnyCommand]
         if self.is_interaction_based():
-            filtered = await self.filter_commands(self.context.bot.tree.get_commands(), sort=True)  # type: ignore
+            commands = self._catalogue.get_sorted(
+                'slash',
+                self.context.bot.tree.get_commands(type=AppCommandType.chat_input),  # type: ignore
+            )
 
         else:
-            filtered = await self.filter_commands(self.context.bot.commands, sort=True)
+            commands = self._catalogue.get_sorted('message', self.context.bot.commands)
+
+        filtered: List[AnyCommand] = await self.filter_commands(commands)
 
         self.pages = self.get_pages(filtered)
         self.current_page = 1
@@ -345,6 +459,9 @@ class RichHelpCommand(HelpCommand, Cog):
             A list of commands.
         """
         try:
+            if self._audience_cache is not None and not self.is_interaction_based():
+                return await self._filter_commands_by_audience(commands, self._audience_cache, sort=sort)  # type: ignore
+
             return await super().filter_commands(commands, sort=sort)  # type: ignore
 
         except Exception:
@@ -355,6 +472,136 @@ class RichHelpCommand(HelpCommand, Cog):
             else:
                 return commands  # type: ignore
 
+    def clear_audience_cache(self) -> None:
+        """Discard the cached results of command checks.
+
+        Cached results expire after a while, but call this after changing checks
+        in a way that :meth:`get_audience_key` does not notice, e.g. role or owner checks.
+        Replaced or disabled commands are detected without this.
+
+        .. versionadded:: 0.2
+        """
+        if self._audience_cache is not None:
+            self._audience_cache.clear()
+
+    async def get_audience_key(self) -> Optional[Hashable]:
+        """|coro|
+
+        Return a key of the audience class of the invoker.
+
+        Invokers with the same key are assumed to pass the same command checks.
+        The default key consists of the channel, the permissions of the invoker and the bot in the channel,
+        the roles and whether the invoker is an owner of the bot.
+        Override this if your checks depend on anything else.
+
+        .. versionadded:: 0.2
+
+        Returns
+        --------
+        Optional[Hashable]
+            A key of the audience class, or None if the result should not be shared.
+        """
+        if self.context.guild is None:
+            return None
+
+        author: Any = self.context.author
+        roles: List[int] = sorted(role.id for role in getattr(author, 'roles', ()))
+        is_owner: bool = await self.context.bot.is_owner(author)
+
+        return (
+            self.context.guild.id,
+            self.context.channel.id,
+            self.context.permissions.value,
+            self.context.bot_permissions.value,
+            tuple(roles),
+            is_owner,
+        )
+
+    async def _filter_commands_by_audience(
+            self,
+            commands: Iterable[Command[Any, ..., Any]],
+            cache: AudienceCache,
+            *,
+            sort: Optional[bool] = False
+    ) -> List[Command[Any, ..., Any]]:
+        """|coro|
+
+        Filter or sort message commands with cached results of command checks.
+        If the audience key cannot be made, this falls back to :meth:`HelpCommand.filter_commands` .
+
+        .. versionadded:: 0.2
+
+        Parameters
+        -----------
+        commands: List[:class:`Command`]
+            A list of commands.
+        cache: :class:`AudienceCache`
+            A cache of command visibilities.
+        sort: Optional[:class:`bool`]
+            Whether to sort the list of commands.
+
+        Returns
+        --------
+        List[:class:`Command`]
+            A list of commands.
+        """
+        key: Optional[Hashable] = None
+        if self.verify_checks is not False:
+            try:
+                key = await self.get_audience_key()
+
+            except Exception:
+                _log.exception('Failed to get the audience key; commands are filtered without the cache')
+
+        if key is None:
+            return await super().filter_commands(commands, sort=bool(sort))
+
+        filtered: List[Command[Any, ..., Any]] = []
+        for command in commands:
+            if (command.hidden and not self.show_hidden) or not command.enabled:
+                continue
+
+            if await self._is_visible(command, key, cache):
+                filtered.append(command)
+
+        if sort:
+            filtered.sort(key=lambda command: command.name)
+
+        return filtered
+
+    async def _is_visible(self, command: Command[Any, ..., Any], key: Hashable, cache: AudienceCache) -> bool:
+        """|coro|
+
+        Check if a command is visible to an audience class, using the cache if possible.
+
+        .. versionadded:: 0.2
+
+        Parameters
+        -----------
+        command: :class:`Command`
+            A command to check.
+        key: Hashable
+            A key of the audience class.
+        cache: :class:`AudienceCache`
+            A cache of command visibilities.
+
+        Returns
+        --------
+        :class:`bool`
+            Whether the command is visible.
+        """
+        visible: Optional[bool] = cache.get(key, command)
+        if visible is None:
+            try:
+                visible = await command.can_run(self.context)
+
+            except CommandError:
+                visible = False
+
+            cache.set(key, command, visible)
+
+        return visible
+
     def get_destination(self) -> Context[Any]:  # type: ignore
         """Return `.context` .
 